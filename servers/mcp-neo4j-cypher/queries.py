@@ -0,0 +1,261 @@
+"""
+Cypher query constants for the MCP Neo4j tool tester.
+
+Keeping the query text in module-level constants guarantees byte-identical
+text on every run, so Neo4j's plan cache (keyed on exact query text) always
+hits, and keeps the test runner itself readable.
+
+Every section projects an explicit map of the properties the runner prints —
+never properties(node) or n{.*} — so adding properties to the graph can't
+silently inflate the response payload. Keep it that way when adding tests.
+"""
+
+# Standalone count used by the runner's simple mode, where the full batched
+# query would be wasted work
+COUNT_AIRCRAFT = "MATCH (a:Aircraft) RETURN count(a) AS aircraft_count"
+
+# All read tests are batched into this single query: one CALL subquery per
+# test, each aggregating to exactly one row, so one read_neo4j_cypher round
+# trip returns a single row with one column per test. The planner can also
+# share Aircraft/System page-cache pulls across subqueries.
+BATCHED_READ_QUERY = """\
+// Shared anchor for the N95040A tests (3, 6, 9): one index hit on the tail
+// number instead of three, and its subgraph pages stay warm across sections
+OPTIONAL MATCH (anchor:Aircraft {tail_number: $tail})
+// TEST 2: Simple Aircraft Count
+CALL {
+    MATCH (a:Aircraft)
+    RETURN count(a) AS aircraft_count
+}
+// TEST 3: Aircraft Tail Number Lookup
+CALL {
+    WITH anchor
+    WITH anchor AS a
+    WHERE a IS NOT NULL
+    RETURN collect({
+        tail_number: a.tail_number,
+        model: a.model,
+        manufacturer: a.manufacturer,
+        operator: a.operator,
+        icao24: a.icao24
+    }) AS aircraft_details
+}
+// TEST 4: Aircraft with Maintenance Events
+// Collecting inside LIMIT-ed subqueries bounds server-side allocation;
+// collect(...)[0..n] would materialize every event before slicing
+CALL {
+    MATCH (a:Aircraft)
+    CALL {
+        WITH a
+        MATCH (a)<-[:AFFECTS_AIRCRAFT]-(m:MaintenanceEvent)
+        RETURN count(m) AS maintenance_count
+    }
+    WITH a, maintenance_count
+    WHERE maintenance_count > 0
+    WITH a, maintenance_count
+    ORDER BY maintenance_count DESC
+    LIMIT 5
+    CALL {
+        WITH a
+        MATCH (a)<-[:AFFECTS_AIRCRAFT]-(m:MaintenanceEvent)
+        WITH m
+        ORDER BY m.reported_at DESC
+        LIMIT 3
+        RETURN collect({
+          fault: m.fault,
+          severity: m.severity,
+          reported_at: m.reported_at
+        }) AS recent_maintenance
+    }
+    RETURN collect({
+        aircraft: a.tail_number,
+        model: a.model,
+        maintenance_count: maintenance_count,
+        recent_maintenance: recent_maintenance
+    }) AS aircraft_with_maintenance
+}
+// TEST 5: Boeing 737 Aircraft with Sensor Data
+// Each count runs in its own subquery: three linear expansions per
+// aircraft instead of one Cartesian product that DISTINCT has to dedup
+CALL {
+    MATCH (a:Aircraft)
+    WHERE a.model CONTAINS $model
+    CALL {
+        WITH a
+        OPTIONAL MATCH (a)-[:HAS_SYSTEM]->(sys:System)
+        RETURN count(sys) AS system_count
+    }
+    CALL {
+        WITH a
+        OPTIONAL MATCH (a)-[:HAS_SYSTEM]->(:System)-[:HAS_SENSOR]->(s:Sensor)
+        RETURN count(s) AS sensor_count
+    }
+    CALL {
+        WITH a
+        OPTIONAL MATCH (a)<-[:AFFECTS_AIRCRAFT]-(m:MaintenanceEvent)
+        RETURN count(m) AS maintenance_event_count
+    }
+    WITH a, system_count, sensor_count, maintenance_event_count
+    ORDER BY sensor_count DESC
+    LIMIT 5
+    RETURN collect({
+        aircraft: a.tail_number,
+        model: a.model,
+        system_count: system_count,
+        sensor_count: sensor_count,
+        maintenance_event_count: maintenance_event_count
+    }) AS boeing_737_sensors
+}
+// TEST 6: Vibration Analysis and Maintenance Correlation
+CALL {
+    WITH anchor
+    WITH anchor AS a
+    WHERE a IS NOT NULL
+    CALL {
+        WITH a
+        OPTIONAL MATCH (a)-[:HAS_SYSTEM]->(:System)-[:HAS_SENSOR]->(s:Sensor)
+        WHERE s.type = 'Vibration' OR s.name CONTAINS 'Vibration' OR s.name CONTAINS 'vibration'
+        RETURN count(s) AS vibration_sensors
+    }
+    CALL {
+        WITH a
+        OPTIONAL MATCH (a)-[:HAS_SYSTEM]->(sys:System)
+        RETURN count(sys) AS systems_monitored
+    }
+    CALL {
+        WITH a
+        MATCH (a)<-[:AFFECTS_AIRCRAFT]-(m:MaintenanceEvent)
+        WITH m
+        ORDER BY m.reported_at DESC
+        LIMIT 5
+        RETURN collect({
+          fault: m.fault,
+          severity: m.severity,
+          system_id: m.system_id,
+          reported_at: m.reported_at
+        }) AS maintenance_events
+    }
+    RETURN collect({
+        aircraft: a.tail_number,
+        vibration_sensors: vibration_sensors,
+        systems_monitored: systems_monitored,
+        maintenance_events: maintenance_events
+    }) AS vibration_and_maintenance
+}
+// TEST 7: Flights with Maintenance-Related Delays
+// Starts from the delay_cause fulltext index (see ensure_indexes) so the
+// filter costs O(matches) instead of a toLower() scan over every Delay
+CALL {
+    CALL db.index.fulltext.queryNodes('delay_cause', $cause_search) YIELD node AS d
+    MATCH (f:Flight)-[:HAS_DELAY]->(d)
+    MATCH (a:Aircraft)-[:OPERATES_FLIGHT]->(f)
+    OPTIONAL MATCH (a)<-[:AFFECTS_AIRCRAFT]-(m:MaintenanceEvent)
+    WHERE m.reported_at IS NOT NULL
+    WITH f, a, d, count(DISTINCT m) AS maintenance_events
+    ORDER BY d.minutes DESC
+    LIMIT 10
+    RETURN collect({
+        flight: f.flight_number,
+        aircraft: a.tail_number,
+        origin: f.origin,
+        destination: f.destination,
+        delay_cause: d.cause,
+        delay_minutes: d.minutes,
+        maintenance_events: maintenance_events
+    }) AS maintenance_delays
+}
+// TEST 8: Aircraft Model Fleet Comparison
+// Single pass over Aircraft — the old version re-matched the Aircraft
+// label per distinct model after already grouping by it
+CALL {
+    MATCH (a:Aircraft)
+    OPTIONAL MATCH (a)-[:OPERATES_FLIGHT]->(f:Flight)
+    WITH a.model AS model,
+         a.manufacturer AS manufacturer,
+         count(DISTINCT a) AS fleet_size,
+         count(DISTINCT f) AS total_flights
+    ORDER BY total_flights DESC
+    LIMIT 10
+    RETURN collect({
+        model: model,
+        manufacturer: manufacturer,
+        aircraft_count: fleet_size,
+        total_flights: total_flights,
+        fleet_size: fleet_size
+    }) AS fleet_comparison
+}
+// TEST 9: Aircraft System Hierarchy
+// Deliberately fixed-depth hops. If this ever becomes a variable-length
+// pattern, bound it (e.g. [:HAS_SYSTEM*1..4]) — an unbounded * enumerates
+// paths exponentially and LIMIT only applies after enumeration.
+CALL {
+    WITH anchor
+    WITH anchor AS a
+    WHERE a IS NOT NULL
+    OPTIONAL MATCH (a)-[:HAS_SYSTEM]->(sys:System)
+    CALL {
+        WITH sys
+        OPTIONAL MATCH (sys)-[:HAS_COMPONENT]->(c:Component)
+        RETURN count(c) AS component_count
+    }
+    CALL {
+        WITH sys
+        OPTIONAL MATCH (sys)-[:HAS_SENSOR]->(s:Sensor)
+        RETURN count(s) AS sensor_count
+    }
+    WITH a.tail_number AS aircraft,
+         collect({
+           system_name: sys.name,
+           system_type: sys.type,
+           components: component_count,
+           sensors: sensor_count
+         }) AS systems
+    RETURN collect({aircraft: aircraft, systems: systems})[0..1] AS system_hierarchy
+}
+// TEST 10: Sensor Reading Statistics
+CALL {
+    MATCH (s:Sensor)
+    OPTIONAL MATCH (sys:System)-[:HAS_SENSOR]->(s)
+    OPTIONAL MATCH (aircraft:Aircraft)-[:HAS_SYSTEM]->(sys)
+    WITH s.type AS sensor_type,
+         count(DISTINCT s) AS sensor_count,
+         count(DISTINCT sys) AS system_count,
+         count(DISTINCT aircraft) AS aircraft_count
+    WHERE sensor_type IS NOT NULL
+    WITH sensor_type, sensor_count, system_count, aircraft_count
+    ORDER BY sensor_count DESC
+    LIMIT 10
+    RETURN collect({
+        sensor_type: sensor_type,
+        sensor_count: sensor_count,
+        system_count: system_count,
+        aircraft_count: aircraft_count
+    }) AS sensor_statistics
+}
+RETURN aircraft_count,
+       aircraft_details,
+       aircraft_with_maintenance,
+       boeing_737_sensors,
+       vibration_and_maintenance,
+       maintenance_delays,
+       fleet_comparison,
+       system_hierarchy,
+       sensor_statistics
+"""
+
+BATCHED_READ_PARAMS = {
+    "tail": "N95040A",
+    "model": "737",
+    # Lucene query: terms are OR-ed, matching the old CONTAINS filter
+    "cause_search": "maintenance technical mechanical",
+}
+
+# Without these, the tail-number and model lookups fall back to full label
+# scans on every run
+INDEX_STATEMENTS = (
+    "CREATE INDEX aircraft_tail IF NOT EXISTS FOR (a:Aircraft) ON (a.tail_number)",
+    "CREATE INDEX aircraft_model IF NOT EXISTS FOR (a:Aircraft) ON (a.model)",
+    "CREATE INDEX sensor_type IF NOT EXISTS FOR (s:Sensor) ON (s.type)",
+    "CREATE INDEX maint_reported IF NOT EXISTS FOR (m:MaintenanceEvent) ON (m.reported_at)",
+    "CREATE FULLTEXT INDEX delay_cause IF NOT EXISTS FOR (d:Delay) ON EACH [d.cause]",
+)